@@ -6,14 +6,26 @@ Requires: customtkinter, pyyaml, pillow (see requirements.txt)
 
 import sys
 import os
+import concurrent.futures
+import functools
+import importlib
+import importlib.util
+import io
+import mmap
+import pickle
+import re
+import shutil
+import threading
 
 # Check for required dependencies
 try:
     import customtkinter as ctk
     from customtkinter import CTkFont
     import yaml
-    from tkinter import filedialog, messagebox
-    from PIL import Image
+    from tkinter import messagebox
+    # Pillow is imported lazily where the logo is loaded
+    if importlib.util.find_spec('PIL') is None:
+        raise ImportError("No module named 'PIL'")
 except ImportError as e:
     missing = str(e).split("'")[1] if "'" in str(e) else str(e)
     print(f"Error: Missing dependency: {missing}")
@@ -28,20 +40,287 @@ except ImportError as e:
     print("    /opt/welcome-app/venv/bin/python3 /opt/welcome-app/welcome_app_modern.py")
     sys.exit(1)
 
-import subprocess
-import configparser
-import urllib.request
-import urllib.error
+# Prefer the LibYAML-backed loader when PyYAML was built with C bindings
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # --- Configuration ---
 CONFIG_FILE = 'config.yaml'
 SETTINGS_FILE = 'user_settings.ini'
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(SCRIPT_DIR, CONFIG_FILE)
+SETTINGS_PATH = os.path.join(SCRIPT_DIR, SETTINGS_FILE)
+LOGO_PATH = os.path.join(SCRIPT_DIR, "logo.png")
+LOGO_SIZE = (128, 128)
+LOGO_CACHE_TEMPLATE = os.path.join(SCRIPT_DIR, "logo.{size}.png")  # LOGO_PATH pre-resized to {size} px
+THEME_PATH = os.path.join(SCRIPT_DIR, "stygian_theme.json")
+CONFIG_CACHE_PATH = CONFIG_PATH + '.pkl'
+CONFIG_CACHE_VERSION = 3  # Bump when the cached config layout changes
 GITHUB_CONFIG_URL = 'https://raw.githubusercontent.com/peter-daptl/stygian-dev-tool-welcome-app/main/config.yaml'
 
+# Terminal emulators to try, in order, with argv templates for running {cmd}
+TERMINAL_TABLE = (
+    ('gnome-terminal', ('--', '/bin/bash', '-c', '{cmd}; echo; echo Press ENTER to exit; read')),
+    ('konsole', ('-e', '/bin/bash', '-c', '{cmd}; echo; echo Press ENTER to exit; read')),
+    ('xfce4-terminal', ('-e', "/bin/bash -c '{cmd}; echo; echo Press ENTER to exit; read'")),
+    ('lxterminal', ('-e', "/bin/bash -c '{cmd}; echo; echo Press ENTER to exit; read'")),
+    ('xterm', ('-e', '/bin/bash', '-c', '{cmd}; echo; echo Press ENTER to exit; read')),
+)
+
+
+# Fixed sections of the generated install script
+PREAMBLE = """#!/usr/bin/env bash
+# Generated by Stygian OS Developer Environment Setup App
+# Handles conflicts with existing installations
+# Avoids snap packages, uses apt repositories
+set -e
+
+# Sudo check
+if [ "$(id -u)" != "0" ]; then
+  echo "Please run as root: sudo -E $0"
+  exit 1
+fi
+
+# Capture the actual user (not root)
+SUDO_USER=${SUDO_USER:-$USER}
+export DEBIAN_FRONTEND=noninteractive
+
+echo "Starting system update..."
+apt update
+apt install -y apt-transport-https ca-certificates gnupg lsb-release curl wget software-properties-common python3 python3-venv unzip zip
+
+""" + "#" * 70
+
+TAIL = """
+
+""" + "#" * 70 + """
+# Cleanup
+echo 'Running cleanup...'
+apt autoremove -y
+apt clean
+
+echo "Installation complete! Please restart your terminal or log out and back in.\""""
+
+PREAMBLE_BYTES = PREAMBLE.encode()
+TAIL_BYTES = TAIL.encode()
+
+
+class _FastIni(dict):
+    """Minimal INI reader/writer for user_settings.ini (section -> {key: value})."""
+
+    _SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+    _ENTRY_RE = re.compile(r'^([^=:\s]+)\s*[:=]\s*(.*?)\s*$')
+    _TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+    def read(self, path):
+        """Merges sections from path; a missing file is silently ignored."""
+        try:
+            with open(path, 'r') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        section = None
+        for line in lines:
+            if not line.strip() or line.lstrip()[0] in '#;':
+                continue
+            match = self._SECTION_RE.match(line)
+            if match:
+                section = self.setdefault(match.group(1), {})
+                continue
+            match = self._ENTRY_RE.match(line)
+            if match and section is not None:
+                section[match.group(1).lower()] = match.group(2)
+
+    def get_value(self, section, key, fallback=None):
+        return self.get(section, {}).get(key, fallback)
+
+    def getboolean(self, section, key, fallback=False):
+        value = self.get_value(section, key)
+        if value is None:
+            return fallback
+        return str(value).lower() in self._TRUE_VALUES
+
+    def write(self, f):
+        f.write(''.join(
+            f'[{name}]\n' + ''.join(f'{k} = {v}\n' for k, v in entries.items()) + '\n'
+            for name, entries in self.items()
+        ))
+
+
+def _map_file(f):
+    """Memory-maps an open binary file read-only and hints the kernel to read it sequentially."""
+    mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+    if hasattr(mm, 'madvise'):
+        for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+            if hasattr(mmap, advice):
+                mm.madvise(getattr(mmap, advice))
+    return mm
+
+
+# Keys of config.yaml the app reads; None marks a string leaf, [schema] a list
+CONFIG_SCHEMA = {
+    'app_name': None,
+    'subtitle': None,
+    'app_version': None,
+    'categories': [{
+        'name': None,
+        'description': None,
+        'options': [{'id': None, 'label': None, 'script': None}],
+    }],
+}
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+_NULL_TAG = 'tag:yaml.org,2002:null'
+
+
+class _StreamingUnsupported(Exception):
+    """Raised when config.yaml uses YAML features the event walker does not handle."""
+
+
+def _build_from_events(event, events, schema, resolver):
+    """Builds the value for event, keeping only the keys listed in schema."""
+    if isinstance(event, yaml.ScalarEvent) and schema is None:
+        if event.tag not in (None, '!'):
+            raise _StreamingUnsupported(f"explicit tag {event.tag}")
+        tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == _STR_TAG:
+            return event.value
+        if tag == _NULL_TAG:
+            return None
+        raise _StreamingUnsupported(f"non-string scalar {event.value!r}")
+    if isinstance(event, yaml.MappingStartEvent) and isinstance(schema, dict):
+        result = {}
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                return result
+            if not isinstance(key_event, yaml.ScalarEvent):
+                raise _StreamingUnsupported("non-scalar mapping key")
+            if key_event.value == '<<':
+                raise _StreamingUnsupported("merge keys")  # Needs the full loader to expand
+            value_event = next(events)
+            if key_event.value in schema:
+                result[key_event.value] = _build_from_events(
+                    value_event, events, schema[key_event.value], resolver
+                )
+            else:
+                _skip_events(value_event, events)
+    if isinstance(event, yaml.SequenceStartEvent) and isinstance(schema, list):
+        result = []
+        for item_event in events:
+            if isinstance(item_event, yaml.SequenceEndEvent):
+                return result
+            result.append(_build_from_events(item_event, events, schema[0], resolver))
+    raise _StreamingUnsupported(f"unexpected {type(event).__name__}")
+
+
+def _skip_events(event, events):
+    """Consumes the events of an unused node without building it."""
+    if isinstance(event, yaml.CollectionStartEvent):
+        depth = 1
+        for event in events:
+            if isinstance(event, yaml.AliasEvent):
+                raise _StreamingUnsupported("aliases")  # Let the full loader resolve them
+            if isinstance(event, yaml.CollectionStartEvent):
+                depth += 1
+            elif isinstance(event, yaml.CollectionEndEvent):
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+def _write_all(fd, data):
+    """Writes all of data to fd, retrying after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_executable(path, data):
+    """Atomically writes data to path as an executable (0755) file."""
+    directory = os.path.dirname(path) or '.'
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    created = False
+    try:
+        # Linux: build the file unnamed, then give it a name once complete
+        fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o700)
+    except (AttributeError, OSError):
+        fd = None
+    if fd is not None:
+        try:
+            _write_all(fd, data)
+            os.fchmod(fd, 0o755)
+            os.link(f'/proc/self/fd/{fd}', temp_path)
+            created = True
+        except OSError:
+            pass  # Fall back to a named temp file below
+        finally:
+            os.close(fd)
+    try:
+        if not created:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o700)
+            created = True
+            try:
+                _write_all(fd, data)
+                os.fchmod(fd, 0o755)
+            finally:
+                os.close(fd)
+        os.replace(temp_path, path)
+    except BaseException:
+        if created:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+        raise
+
+
+def _run_in_background(fn, *args):
+    """Runs fn on a daemon thread and returns a Future for the Tk thread to poll.
+
+    Unlike executor workers, the thread is not joined at exit, so a slow
+    network call never delays closing the app.
+    """
+    future = concurrent.futures.Future()
+
+    def worker():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+
+def _detect_terminal():
+    """Returns (path, argv template) for the first installed terminal, or None."""
+    for terminal_name, argv in TERMINAL_TABLE:
+        terminal_path = shutil.which(terminal_name)
+        if terminal_path:
+            return terminal_path, argv
+    return None
+
+
+def _prefetch_file(path):
+    """Asks the kernel to start reading a file into the page cache in the background."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
 # Set appearance
 ctk.set_appearance_mode("dark")
-script_dir = os.path.dirname(os.path.abspath(__file__))
-theme_path = os.path.join(script_dir, "stygian_theme.json")
 
 class ModernWelcomeApp:
     
@@ -54,72 +333,91 @@ class ModernWelcomeApp:
         # Set minimum window size
         self.master.minsize(1000, 600)
         
-        self.options = {}  # Dictionary to store IntVar for each option
-        self.script_content = ""
+        self.option_ids = []  # Option id for each checkbox, indexed by bit position
+        self.option_checkboxes = []
+        self.selected_mask = 0  # Bit i set when option_ids[i] is selected
+        self.script_body = ""  # Generated script between PREAMBLE and TAIL
+        self._launch_future = None  # Pending Run Script launch, if any
 
-        # Update config from GitHub before loading
-        self._update_config_from_github()
-
-        # Load application and user settings
-        self.config = self._load_config()
+        # User settings come first so hide-on-startup skips all other work
         self.user_settings = self._load_user_settings()
 
-        if not self.config:
-            self._show_error("Configuration Error", f"Could not load or parse {CONFIG_FILE}.")
-            return
-
         # Check for "Do not show again" setting
         if self.user_settings.getboolean('General', 'hide_on_startup', fallback=False):
             print("Auto-hiding app as 'hide_on_startup' is enabled in user settings.")
             self.master.withdraw()
-            self.master.after(100, self.master.quit)
+            self.master.after(0, self.master.quit)
             return
 
-        # Define fonts
-        self.GLOBAL_APP_FONT = CTkFont(
-            family="Fira Code",
-            size=12,
-            weight="normal"
-        )
-        
-        self.TITLE_FONT = CTkFont(
-            family="Fira Code",
-            size=28,
-            weight="bold"
-        )
+        # Independent startup I/O runs on daemon threads while the config loads
+        self._terminal_future = _run_in_background(_detect_terminal)  # Terminals don't change mid-session
+        _run_in_background(importlib.import_module, 'PIL.Image')  # Warm Pillow for the logo
 
-        self.SUB_TITLE_FONT = CTkFont(
-            family="Fira Code",
-            size=18,
-            weight="bold"
-        )
-        
-        self.HEADING_FONT = CTkFont(
-            family="Fira Code",
-            size=18,
-            weight="bold"
-        )
-        
-        self.BUTTON_FONT = CTkFont(
-            family="Fira Code",
-            size=13,
-            weight="bold"
-        )
-        
-        self.CODE_FONT = CTkFont(
-            family="Fira Code",
-            size=10,
-            weight="normal"
-        )
+        # Load application settings
+        try:
+            self.config = self._read_config()
+        except Exception as e:
+            print(f"⚠ Local config.yaml is unusable: {e}")
+            self.config = None
+
+        if self.config:
+            # Fetch config updates from GitHub only after the local copy is
+            # parsed, so a download cannot replace config.yaml mid-load. It is
+            # not waited on; the local copy is used this session.
+            self._config_update_future = _run_in_background(
+                self._update_config_from_github,
+                dict(self.user_settings.get('GitHub', {}))
+            )
+        else:
+            # Missing or broken local config: wait for a full download so a
+            # fresh install or an upstream fix repairs it, then load again
+            self._config_update_future = None
+            validators = self._update_config_from_github({})
+            self.config = self._load_config()
+            if self.config and validators is not None:
+                self._store_github_validators(validators)
+
+        if not self.config:
+            self._show_error("Configuration Error", f"Could not load or parse {CONFIG_FILE}.")
+            return
+
+        # Define fonts
+        self.GLOBAL_APP_FONT = self._font("Fira Code", 12)
+        self.TITLE_FONT = self._font("Fira Code", 28, weight="bold")
+        self.SUB_TITLE_FONT = self._font("Fira Code", 18, weight="bold")
+        self.HEADING_FONT = self._font("Fira Code", 18, weight="bold")
+        self.BUTTON_FONT = self._font("Fira Code", 13, weight="bold")
+        self.CODE_FONT = self._font("Fira Code", 10)
 
         self._create_widgets()
+        if self._config_update_future is not None:
+            self.master.after(250, self._poll_config_update)
+
+    @property
+    def script_content(self):
+        """The full generated install script."""
+        return PREAMBLE + self.script_body + TAIL
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _font(cls, family, size, weight="normal", slant="roman"):
+        """Returns a shared CTkFont so identical fonts register with Tk only once."""
+        return CTkFont(family=family, size=size, weight=weight, slant=slant)
+
+    def _update_config_from_github(self, cached):
+        """Downloads the latest config.yaml from GitHub.
+
+        cached holds the [GitHub] settings of the last good download. Runs on
+        a worker thread and touches neither Tk nor user settings. Returns the
+        new validators, plus the written file's mtime/size, as a dict if the
+        file was replaced, otherwise None.
+        """
+        import urllib.request
+        import urllib.error
 
-    def _update_config_from_github(self):
-        """Downloads the latest config.yaml from GitHub."""
         try:
             print("Checking for config updates from GitHub...")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            local_config = os.path.join(script_dir, CONFIG_FILE)
+            temp_config = CONFIG_PATH + '.tmp'
             
             # Download with timeout
             req = urllib.request.Request(
@@ -127,30 +425,112 @@ class ModernWelcomeApp:
                 headers={'User-Agent': 'Stygian-OS-Welcome-App'}
             )
             
-            with urllib.request.urlopen(req, timeout=5) as response:
-                content = response.read()
-                
-                # Write to file
-                with open(local_config, 'wb') as f:
-                    f.write(content)
+            # Ask GitHub to skip the body only if config.yaml is still the
+            # exact file we downloaded (not edited, reinstalled or checked out)
+            try:
+                config_stat = os.stat(CONFIG_PATH)
+                unchanged = (
+                    cached.get('config_mtime_ns') == str(config_stat.st_mtime_ns)
+                    and cached.get('config_size') == str(config_stat.st_size)
+                )
+            except OSError:
+                unchanged = False
+            if unchanged:
+                if cached.get('etag'):
+                    req.add_header('If-None-Match', cached['etag'])
+                if cached.get('last_modified'):
+                    req.add_header('If-Modified-Since', cached['last_modified'])
+            
+            with urllib.request.urlopen(req, timeout=2) as response:
+                # Stream to a temp file and swap it in atomically
+                with open(temp_config, 'wb') as f:
+                    shutil.copyfileobj(response, f, 65536)
+                os.replace(temp_config, CONFIG_PATH)
+                config_stat = os.stat(CONFIG_PATH)
                 
                 print("✓ Config updated successfully from GitHub")
+                return {
+                    'etag': response.headers.get('ETag', ''),
+                    'last_modified': response.headers.get('Last-Modified', ''),
+                    'config_mtime_ns': str(config_stat.st_mtime_ns),
+                    'config_size': str(config_stat.st_size),
+                }
                 
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                print("✓ Config is up to date")
+            else:
+                print(f"⚠ Could not fetch config from GitHub: {e}")
+                print("  Using local config.yaml")
         except urllib.error.URLError as e:
             print(f"⚠ Could not fetch config from GitHub: {e}")
             print("  Using local config.yaml")
         except Exception as e:
             print(f"⚠ Error updating config: {e}")
             print("  Using local config.yaml")
+        return None
+
+    def _poll_config_update(self):
+        """Checks from the Tk thread whether the background config fetch finished."""
+        if not self._config_update_future.done():
+            self.master.after(250, self._poll_config_update)
+        else:
+            validators = self._config_update_future.result()
+            if validators is not None:
+                self._prepare_downloaded_config(validators)
+
+    def _prepare_downloaded_config(self, validators):
+        """Parses a freshly downloaded config to warm the cache for next launch.
+
+        Errors are only logged: this session keeps using its current config.
+        """
+        try:
+            new_config = self._read_config()
+        except Exception as e:
+            print(f"⚠ Downloaded config.yaml could not be parsed: {e}")
+            return
+        if not new_config:
+            print("⚠ Downloaded config.yaml is empty")
+            return
+        self._store_github_validators(validators)
+        if new_config != self.config:
+            print("  New config downloaded; changes will apply on next launch")
+
+    def _store_github_validators(self, validators):
+        """Saves the response validators of the last good config download."""
+        if 'GitHub' not in self.user_settings:
+            self.user_settings['GitHub'] = {}
+        self.user_settings['GitHub'].update(validators)
+        self._save_user_settings()
+
+    def _read_config(self):
+        """Parses config.yaml (or its cache); raises on failure, None if empty."""
+        cached = self._load_config_cache()
+        if cached is not None:
+            return cached
+        with open(CONFIG_PATH, 'rb') as f:
+            # Key the cache on the file actually parsed, even if a
+            # download replaces config.yaml while we read it
+            parsed_stat = os.fstat(f.fileno())
+            if parsed_stat.st_size == 0:
+                return None  # mmap cannot map an empty file
+            mm = _map_file(f)
+        try:
+            try:
+                config = self._load_config_streaming(mm)
+            except _StreamingUnsupported as e:
+                print(f"Falling back to full YAML load: {e}")
+                mm.seek(0)
+                config = yaml.load(mm, Loader=_YamlLoader)
+        finally:
+            mm.close()
+        self._save_config_cache(config, parsed_stat)
+        return config
 
     def _load_config(self):
         """Loads and parses the YAML configuration file."""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            config_path = os.path.join(script_dir, CONFIG_FILE)
-            
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return self._read_config()
         except FileNotFoundError:
             self._show_error("File Not Found", f"Configuration file '{CONFIG_FILE}' not found.")
             return None
@@ -161,20 +541,54 @@ class ModernWelcomeApp:
             self._show_error("Error", f"An unexpected error occurred: {e}")
             return None
 
+    def _load_config_streaming(self, stream):
+        """Parses only the CONFIG_SCHEMA keys from the YAML event stream."""
+        events = yaml.parse(stream, Loader=_YamlLoader)
+        resolver = yaml.resolver.Resolver()
+        config = None
+        documents = 0
+        # Drain the whole stream so trailing syntax errors still raise
+        for event in events:
+            if isinstance(event, yaml.DocumentStartEvent):
+                documents += 1
+                if documents > 1:
+                    raise _StreamingUnsupported("multiple documents")  # Full loader reports it
+                config = _build_from_events(next(events), events, CONFIG_SCHEMA, resolver)
+        return config
+
+    def _load_config_cache(self):
+        """Returns the pickled config if it was parsed from the current config.yaml, else None."""
+        try:
+            yaml_stat = os.stat(CONFIG_PATH)
+            with open(CONFIG_CACHE_PATH, 'rb') as f:
+                version, mtime_ns, size, config = pickle.load(f)
+        except Exception:
+            return None
+        if (version, mtime_ns, size) != (CONFIG_CACHE_VERSION, yaml_stat.st_mtime_ns, yaml_stat.st_size):
+            return None
+        return config
+
+    def _save_config_cache(self, config, parsed_stat):
+        """Pickles the config parsed from the file described by parsed_stat."""
+        temp_cache = CONFIG_CACHE_PATH + '.tmp'
+        entry = (CONFIG_CACHE_VERSION, parsed_stat.st_mtime_ns, parsed_stat.st_size, config)
+        try:
+            with open(temp_cache, 'wb') as f:
+                pickle.dump(entry, f, protocol=5)
+            os.replace(temp_cache, CONFIG_CACHE_PATH)
+        except Exception as e:
+            print(f"Warning: Could not cache config. Error: {e}")
+
     def _load_user_settings(self):
-        """Loads persistent user settings using configparser."""
-        settings = configparser.ConfigParser()
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        settings_path = os.path.join(script_dir, SETTINGS_FILE)
-        settings.read(settings_path)
+        """Loads persistent user settings from the INI file."""
+        settings = _FastIni()
+        settings.read(SETTINGS_PATH)
         return settings
 
     def _save_user_settings(self):
         """Saves persistent user settings."""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            settings_path = os.path.join(script_dir, SETTINGS_FILE)
-            with open(settings_path, 'w') as configfile:
+            with open(SETTINGS_PATH, 'w') as configfile:
                 self.user_settings.write(configfile)
         except Exception as e:
             print(f"Warning: Could not save user settings. Error: {e}")
@@ -195,6 +609,10 @@ class ModernWelcomeApp:
         self.tabview = ctk.CTkTabview(self.master)
         self.tabview.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
+        # Start kernel readahead of the logo while the category tabs are built
+        logo_cache_path = self._logo_cache_path()
+        _prefetch_file(logo_cache_path if os.path.exists(logo_cache_path) else LOGO_PATH)
+
         # Create tabs
         self.welcome_tab = self.tabview.add("Welcome")
         
@@ -211,7 +629,7 @@ class ModernWelcomeApp:
         self._create_welcome_content()
         self._create_actions_content()
 
-        tab_font = CTkFont(family="Fira Code", size=11, weight="normal")
+        tab_font = self._font("Fira Code", 11)
         for button in self.tabview._segmented_button._buttons_dict.values():
             button.configure(font=tab_font)
 
@@ -236,15 +654,20 @@ class ModernWelcomeApp:
 
         logo_loaded = False
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            logo_path = os.path.join(script_dir, "logo.png")
-            
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
+            if os.path.exists(LOGO_PATH):
+                from PIL import Image
+
+                with open(self._resized_logo_path(), 'rb') as f:
+                    mm = _map_file(f)
+                try:
+                    logo_img = Image.open(mm)
+                    logo_img.load()  # Decode now so the mapping can be released
+                finally:
+                    mm.close()
                 logo_photo = ctk.CTkImage(
                     light_image=logo_img,
                     dark_image=logo_img,
-                    size=(128, 128)
+                    size=LOGO_SIZE
                 )
                 
                 logo_label = ctk.CTkLabel(
@@ -315,7 +738,7 @@ This utility streamlines your path to a production-ready development environment
         info_textbox = ctk.CTkTextbox(
             info_frame,
             wrap="word",
-            font=CTkFont(family="Fira Code", size=14, weight="normal")
+            font=self._font("Fira Code", 14)
         )
         info_textbox.pack(padx=20, pady=20, fill="both", expand=True)
         info_textbox.insert("0.0", intro_text)
@@ -348,6 +771,37 @@ This utility streamlines your path to a production-ready development environment
         )
         hide_cb.pack(pady=20)
 
+    def _logo_pixel_size(self):
+        """Returns the on-screen logo size in pixels, as CTkImage will render it."""
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.master)
+        return tuple(round(side * scaling) for side in LOGO_SIZE)
+
+    def _logo_cache_path(self):
+        """Returns the cache file for the logo at the current scaling."""
+        return LOGO_CACHE_TEMPLATE.format(size=self._logo_pixel_size()[0])
+
+    def _resized_logo_path(self):
+        """Returns the pre-resized logo, regenerating it if the source is newer."""
+        cache_path = self._logo_cache_path()
+        try:
+            if os.stat(cache_path).st_mtime >= os.stat(LOGO_PATH).st_mtime:
+                return cache_path
+        except FileNotFoundError:
+            pass
+
+        from PIL import Image
+
+        temp_cache = cache_path + '.tmp'
+        try:
+            with Image.open(LOGO_PATH) as img:
+                resized = img.resize(self._logo_pixel_size(), Image.Resampling.LANCZOS)
+                resized.save(temp_cache, format='PNG', optimize=True)
+            os.replace(temp_cache, cache_path)
+            return cache_path
+        except Exception as e:
+            print(f"Warning: Could not cache resized logo. Error: {e}")
+            return LOGO_PATH
+
     def _on_hide_checkbox_click(self):
         """Called when the 'Do not show again' checkbox is toggled."""
         state = self.hide_on_startup_var.get()
@@ -369,7 +823,7 @@ This utility streamlines your path to a production-ready development environment
         desc = ctk.CTkLabel(
             desc_frame,
             text=category_data.get('description', ''),
-            font=CTkFont(family="Fira Code", size=12, slant="italic"),
+            font=self._font("Fira Code", 12, slant="italic"),
             wraplength=1100,
             text_color="#8a8a8a"
         )
@@ -381,18 +835,23 @@ This utility streamlines your path to a production-ready development environment
 
         # Create checkboxes with better spacing
         for option in category_data.get('options', []):
-            opt_id = option['id']
-            self.options[opt_id] = ctk.IntVar(value=0)
+            idx = len(self.option_ids)
+            self.option_ids.append(option['id'])
 
             cb = ctk.CTkCheckBox(
                 scrollable,
                 text=option['label'],
-                variable=self.options[opt_id],
+                command=lambda i=idx: self._toggle_option(i),
                 font=self.GLOBAL_APP_FONT,
                 checkbox_width=22,
                 checkbox_height=22
             )
             cb.pack(pady=6, padx=15, anchor="w")
+            self.option_checkboxes.append(cb)
+
+    def _toggle_option(self, idx):
+        """Flips the selection bit for the option at idx."""
+        self.selected_mask ^= 1 << idx
 
     def _create_actions_content(self):
         """Creates the actions/generate tab content."""
@@ -442,7 +901,7 @@ This utility streamlines your path to a production-ready development environment
         output_label = ctk.CTkLabel(
             self.actions_tab,
             text="Generated Script:",
-            font=CTkFont(family="Fira Code", size=15, weight="bold")
+            font=self._font("Fira Code", 15, weight="bold")
         )
         output_label.pack(pady=(25, 8), anchor="w", padx=30)
 
@@ -455,58 +914,33 @@ This utility streamlines your path to a production-ready development environment
 
     def _clear_all(self):
         """Clears all selected options."""
-        for var in self.options.values():
-            var.set(0)
+        self.selected_mask = 0
+        for cb in self.option_checkboxes:
+            cb.deselect()
         messagebox.showinfo("Cleared", "All selections have been cleared.")
 
     def _generate_script(self):
         """Generates the installation script."""
-        selected_ids = {opt_id for opt_id, var in self.options.items() if var.get() == 1}
+        selected = []
+        mask = self.selected_mask
+        while mask:
+            selected.append(self.option_ids[(mask & -mask).bit_length() - 1])
+            mask &= mask - 1
+        selected_ids = frozenset(selected)
 
         if not selected_ids:
             messagebox.showwarning("No Selection", "Please select at least one tool to install.")
             return
 
-        lines = []
-        lines.append("#!/usr/bin/env bash")
-        lines.append("# Generated by Stygian OS Developer Environment Setup App")
-        lines.append("# Handles conflicts with existing installations")
-        lines.append("# Avoids snap packages, uses apt repositories")
-        lines.append("set -e")
-        lines.append("")
-        lines.append("# Sudo check")
-        lines.append('if [ "$(id -u)" != "0" ]; then')
-        lines.append('  echo "Please run as root: sudo -E $0"')
-        lines.append('  exit 1')
-        lines.append('fi')
-        lines.append("")
-        lines.append("# Capture the actual user (not root)")
-        lines.append('SUDO_USER=${SUDO_USER:-$USER}')
-        lines.append('export DEBIAN_FRONTEND=noninteractive')
-        lines.append("")
-        lines.append('echo "Starting system update..."')
-        lines.append('apt update')
-        lines.append('apt install -y apt-transport-https ca-certificates gnupg lsb-release curl wget software-properties-common python3 python3-venv unzip zip')
-        lines.append("")
-        lines.append("#" * 70)
-
+        buf = io.StringIO()
         for category in self.config.get('categories', []):
-            lines.append(f"\n# --- {category['name']} ---")
+            buf.write(f"\n\n# --- {category['name']} ---")
             for option in category.get('options', []):
                 if option['id'] in selected_ids:
-                    lines.append(f"\necho 'Installing: {option['label']}...'")
-                    script_content = option['script'].strip()
-                    lines.append(script_content)
-
-        lines.append("\n" + "#" * 70)
-        lines.append("# Cleanup")
-        lines.append("echo 'Running cleanup...'")
-        lines.append("apt autoremove -y")
-        lines.append("apt clean")
-        lines.append("")
-        lines.append('echo "Installation complete! Please restart your terminal or log out and back in."')
-
-        self.script_content = "\n".join(lines)
+                    buf.write(f"\n\necho 'Installing: {option['label']}...'\n")
+                    buf.write(option['script'].strip())
+
+        self.script_body = buf.getvalue()
         self.script_textbox.delete("0.0", "end")
         self.script_textbox.insert("0.0", self.script_content)
 
@@ -516,9 +950,11 @@ This utility streamlines your path to a production-ready development environment
 
     def _save_script(self):
         """Saves the generated script to a file."""
-        if not self.script_content:
+        from tkinter import filedialog
+
+        if not self.script_body:
             self._generate_script()
-            if not self.script_content:
+            if not self.script_body:
                 return
 
         filename = filedialog.asksaveasfilename(
@@ -529,8 +965,10 @@ This utility streamlines your path to a production-ready development environment
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.script_content)
+                with open(filename, 'wb') as f:
+                    f.write(PREAMBLE_BYTES)
+                    f.write(self.script_body.encode())
+                    f.write(TAIL_BYTES)
                 os.chmod(filename, 0o755)
                 messagebox.showinfo("Success", f"Script saved to:\n{filename}\n\nRun with: sudo -E {filename}")
             except Exception as e:
@@ -538,52 +976,55 @@ This utility streamlines your path to a production-ready development environment
 
     def _run_script_in_terminal(self):
         """Runs the script in a new terminal window."""
-        if not self.script_content:
+        import subprocess
+
+        if self._launch_future is not None:
+            return  # A launch is still in progress; ignore repeated clicks
+
+        if not self.script_body:
             self._generate_script()
-            if not self.script_content:
+            if not self.script_body:
                 return
 
-        try:
-            temp_script_path = "/tmp/install_dev_env.sh"
-            with open(temp_script_path, 'w') as f:
-                f.write(self.script_content)
-            os.chmod(temp_script_path, 0o755)
+        temp_script_path = "/tmp/install_dev_env.sh"
+        command = f'sudo -E "{temp_script_path}"'
 
-            command = f'sudo -E "{temp_script_path}"'
-            
-            terminal_cmds = [
-                f'gnome-terminal -- /bin/bash -c "{command}; echo; echo Press ENTER to exit; read"',
-                f'konsole -e /bin/bash -c "{command}; echo; echo Press ENTER to exit; read"',
-                f'xfce4-terminal -e "/bin/bash -c \'{command}; echo; echo Press ENTER to exit; read\'"',
-                f'lxterminal -e "/bin/bash -c \'{command}; echo; echo Press ENTER to exit; read\'"',
-                f'xterm -e /bin/bash -c "{command}; echo; echo Press ENTER to exit; read"'
-            ]
-            
-            launched = False
-            for cmd in terminal_cmds:
-                terminal_name = cmd.split()[0]
-                if subprocess.run(f'which {terminal_name}', shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0:
-                    subprocess.Popen(cmd, shell=True)
-                    launched = True
-                    break
-
-            if not launched:
-                messagebox.showerror(
-                    "Error",
-                    "Could not find a terminal emulator.\n"
-                    f"Please save the script and run manually:\nsudo -E {temp_script_path}"
-                )
-                return
+        terminal = self._terminal_future.result()
+        if terminal is None:
+            messagebox.showerror(
+                "Error",
+                "Could not find a terminal emulator.\n"
+                f"Please save the script and run manually:\nsudo -E {temp_script_path}"
+            )
+            return
+        terminal_path, argv = terminal
+
+        script_data = b''.join([PREAMBLE_BYTES, self.script_body.encode(), TAIL_BYTES])
 
+        def launch():
+            _write_executable(temp_script_path, script_data)
+            subprocess.Popen([terminal_path] + [arg.format(cmd=command) for arg in argv])
+
+        # Write and spawn off the Tk thread so the UI stays responsive
+        self._launch_future = _run_in_background(launch)
+        self.master.after(50, self._poll_script_launch)
+
+    def _poll_script_launch(self):
+        """Reports the outcome of the background script launch on the Tk thread."""
+        future = self._launch_future
+        if not future.done():
+            self.master.after(50, self._poll_script_launch)
+            return
+        self._launch_future = None
+        if future.exception() is not None:
+            self._show_error("Execution Error", f"Failed to run script: {future.exception()}")
+        else:
             messagebox.showinfo(
                 "Running",
                 "Installation script launched in a new terminal.\n"
                 "You will be prompted for your sudo password."
             )
 
-        except Exception as e:
-            self._show_error("Execution Error", f"Failed to run script: {e}")
-
 
 def main():
     root = ctk.CTk()